@@ -21,6 +21,7 @@ from rich.logging import RichHandler
 
 from src.orchestrator import Orchestrator
 from src.aggregator import Aggregator
+from src.utils import VALID_STATES
 from src.cli_adapters.gemini_adapter import GeminiAdapter
 
 
@@ -69,7 +70,17 @@ def cli():
     is_flag=True,
     help="Skip aggregation after research completes"
 )
-def research(target, states, workers, config, skip_aggregate):
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent per-task JSON outputs for easier inspection"
+)
+@click.option(
+    "--stream-aggregate",
+    is_flag=True,
+    help="Aggregate results as tasks complete (this run's results only)"
+)
+def research(target, states, workers, config, skip_aggregate, pretty, stream_aggregate):
     """
     Run market research for specified states.
 
@@ -81,15 +92,7 @@ def research(target, states, workers, config, skip_aggregate):
     state_list = [s.strip().upper() for s in states.split(",")]
 
     # Validate states
-    valid_states = {
-        "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-        "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-        "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-        "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-        "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"
-    }
-
-    invalid_states = [s for s in state_list if s not in valid_states]
+    invalid_states = [s for s in state_list if s not in VALID_STATES]
     if invalid_states:
         console.print(f"[red]Invalid state codes: {', '.join(invalid_states)}[/red]")
         sys.exit(1)
@@ -106,10 +109,18 @@ def research(target, states, workers, config, skip_aggregate):
     # Override workers if specified
     if workers:
         orchestrator.worker_pool.max_workers = workers
+        orchestrator.adapter.max_concurrent = workers
+
+    if pretty:
+        orchestrator.worker_pool.pretty_json = True
 
     # Run research
     try:
-        summary = orchestrator.run(state_list, skip_aggregation=skip_aggregate)
+        summary = orchestrator.run(
+            state_list,
+            skip_aggregation=skip_aggregate,
+            stream_aggregation=stream_aggregate
+        )
 
         if "error" in summary:
             console.print(f"[red]Research failed: {summary['error']}[/red]")
@@ -8,20 +8,30 @@ and exporting to JSON and CSV formats.
 import csv
 import json
 import logging
+import os
+import re
 from pathlib import Path
+from collections import Counter, defaultdict
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
 from rich.table import Table
 
+from .utils import json_loads, json_dumps
+
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Trailing legal suffixes ignored when comparing company names
+_SUFFIX_RE = re.compile(r",?\s+(?:llc|inc|corp|company|co)\.?\s*$", re.IGNORECASE)
+
 
-@dataclass
+@dataclass(slots=True)
 class Business:
     """Represents a business found during research."""
     company_name: str
@@ -34,6 +44,14 @@ class Business:
     industry: Optional[str] = None
     source_task: Optional[str] = None
     extra_data: dict = field(default_factory=dict)
+    # Derived dedup columns, computed once at construction
+    completeness: int = field(init=False, repr=False, compare=False)
+    fingerprint: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.completeness = self.filled_field_count()
+        # 64-bit hash of the deduplication identity, without building the key string
+        self.fingerprint = hash(self._normalized_identity())
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -50,15 +68,121 @@ class Business:
             **self.extra_data
         }
 
+    def _normalized_identity(self) -> tuple[str, str, str]:
+        """Normalize company name, city and state for comparison."""
+        name = _SUFFIX_RE.sub("", self.company_name.strip()).lower()
+        return name, self.city.lower(), self.state.upper()
+
     @property
     def dedup_key(self) -> str:
         """Generate a key for deduplication."""
-        # Normalize company name for comparison
-        name = self.company_name.lower().strip()
-        # Remove common suffixes
-        for suffix in [" llc", " inc", " corp", " company", " co"]:
-            name = name.replace(suffix, "")
-        return f"{name}|{self.city.lower()}|{self.state.upper()}"
+        return "|".join(self._normalized_identity())
+
+    def filled_field_count(self) -> int:
+        """Count populated fields, including extra data, without building a dict."""
+        count = sum(1 for name in _CORE_FIELDS if getattr(self, name))
+        return count + sum(1 for v in self.extra_data.values() if v)
+
+
+# Business fields that map directly to output columns
+_CORE_FIELDS = (
+    "company_name", "city", "state", "address", "phone",
+    "website", "email", "industry", "source_task"
+)
+
+
+# Shapes of worker output files, indexes into _HANDLERS
+_SHAPE_CITY_SEARCH, _SHAPE_COMPANY_RESEARCH, _SHAPE_LIST = 0, 1, 2
+
+
+def _classify(data) -> Optional[int]:
+    """Identify the shape of a worker output document, or None if unknown."""
+    if isinstance(data, dict):
+        if "businesses" in data:
+            return _SHAPE_CITY_SEARCH
+        if "company_name" in data:
+            return _SHAPE_COMPANY_RESEARCH
+        return None
+    if isinstance(data, list):
+        return _SHAPE_LIST
+    return None
+
+
+def _make_business(
+    biz: dict,
+    city: str = "",
+    state: str = "",
+    industry: Optional[str] = None,
+    source_task: Optional[str] = None
+) -> Business:
+    """Build a Business from a flat record, using the given location defaults."""
+    return Business(
+        company_name=biz.get("company_name", ""),
+        city=biz.get("city", city),
+        state=biz.get("state", state),
+        address=biz.get("address"),
+        phone=biz.get("phone"),
+        website=biz.get("website"),
+        email=biz.get("email"),
+        industry=industry,
+        source_task=source_task
+    )
+
+
+def _from_city_search(data: dict, source: str) -> list[Business]:
+    """Handle city_search results (array of businesses)."""
+    city = data.get("city", "")
+    state = data.get("state", "")
+    industry = data.get("industry", "")
+    task_id = data.get("task_id", source)
+
+    return [
+        _make_business(biz, city, state, industry, task_id)
+        for biz in data.get("businesses", [])
+        if biz.get("company_name")
+    ]
+
+
+def _from_company_research(data: dict, source: str) -> list[Business]:
+    """Handle company_research results (single company)."""
+    location = data.get("location", {})
+    contact = data.get("contact", {})
+
+    return [Business(
+        company_name=data.get("company_name", ""),
+        city=location.get("city", ""),
+        state=location.get("state", ""),
+        address=location.get("address"),
+        phone=contact.get("phone"),
+        website=contact.get("website"),
+        email=contact.get("email"),
+        source_task=data.get("task_id", source),
+        extra_data={
+            "business_details": data.get("business_details"),
+            "key_contacts": data.get("key_contacts"),
+            "online_presence": data.get("online_presence")
+        }
+    )]
+
+
+def _from_list(data: list, source: str) -> list[Business]:
+    """Handle a direct array of businesses."""
+    return [
+        _make_business(biz, source_task=source)
+        for biz in data
+        if isinstance(biz, dict) and biz.get("company_name")
+    ]
+
+
+_HANDLERS = (_from_city_search, _from_company_research, _from_list)
+
+
+def _keep_richest(seen: dict[int, Business], biz: Business) -> None:
+    """Record biz under its fingerprint unless an equally complete record exists."""
+    existing = seen.get(biz.fingerprint)
+    # Keep the one with more data
+    if existing is None or biz.completeness > existing.completeness:
+        seen[biz.fingerprint] = biz
 
 
 class Aggregator:
@@ -87,6 +211,11 @@ class Aggregator:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Running dedup state for results streamed in via ingest_one()
+        self._ingested: dict[int, Business] = {}
+        self._ingested_files = 0
+        self._ingested_records = 0
+
     def load_results(self) -> list[dict]:
         """
         Load all JSON result files from input directory.
@@ -94,30 +223,56 @@ class Aggregator:
         Returns:
             List of parsed JSON data from each file
         """
-        results = []
-
-        json_files = list(self.input_dir.glob("*.json"))
+        if not self.input_dir.is_dir():
+            logger.warning(f"Input directory not found: {self.input_dir}")
+            return []
+
+        # scandir entries carry the name and file type, so filtering needs no extra stat()
+        with os.scandir(self.input_dir) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                # Skip files ending with _raw.json
+                if entry.name.endswith(".json")
+                and not entry.name.endswith("_raw.json")
+                and entry.is_file()
+            ]
         logger.info(f"Found {len(json_files)} JSON files in {self.input_dir}")
 
-        for file_path in json_files:
-            # Skip files ending with _raw.json
-            if file_path.stem.endswith("_raw"):
-                continue
-
-            try:
-                with open(file_path) as f:
-                    data = json.load(f)
-                    results.append({
-                        "file": file_path.name,
-                        "data": data
-                    })
-                    logger.debug(f"Loaded {file_path.name}")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse {file_path.name}: {e}")
-            except Exception as e:
-                logger.error(f"Error reading {file_path.name}: {e}")
-
-        return results
+        if not json_files:
+            return []
+
+        # File reads are I/O-bound, so overlap them across threads.
+        # map() keeps results in file order, which deduplication relies on.
+        with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+            return [
+                result for result in executor.map(self._load_one, json_files)
+                if result is not None
+            ]
+
+    def _load_one(self, file_path: Path) -> Optional[dict]:
+        """
+        Load a single JSON result file.
+
+        Args:
+            file_path: Path to the JSON file
+
+        Returns:
+            Dict with the file name and parsed data, or None on failure
+        """
+        try:
+            # Hand raw bytes to the parser; skips the text-mode decode layer
+            data = json_loads(file_path.read_bytes())
+            logger.debug(f"Loaded {file_path.name}")
+            return {
+                "file": file_path.name,
+                "data": data
+            }
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse {file_path.name}: {e}")
+        except Exception as e:
+            logger.error(f"Error reading {file_path.name}: {e}")
+
+        return None
 
     def extract_businesses(self, results: list[dict]) -> list[Business]:
         """
@@ -133,66 +288,9 @@ class Aggregator:
 
         for result in results:
             data = result["data"]
-            source = result["file"]
-
-            # Handle city_search results (array of businesses)
-            if isinstance(data, dict) and "businesses" in data:
-                city = data.get("city", "")
-                state = data.get("state", "")
-                industry = data.get("industry", "")
-                task_id = data.get("task_id", source)
-
-                for biz in data.get("businesses", []):
-                    if not biz.get("company_name"):
-                        continue
-
-                    businesses.append(Business(
-                        company_name=biz.get("company_name", ""),
-                        city=biz.get("city", city),
-                        state=biz.get("state", state),
-                        address=biz.get("address"),
-                        phone=biz.get("phone"),
-                        website=biz.get("website"),
-                        email=biz.get("email"),
-                        industry=industry,
-                        source_task=task_id
-                    ))
-
-            # Handle company_research results (single company)
-            elif isinstance(data, dict) and "company_name" in data:
-                location = data.get("location", {})
-                contact = data.get("contact", {})
-
-                businesses.append(Business(
-                    company_name=data.get("company_name", ""),
-                    city=location.get("city", ""),
-                    state=location.get("state", ""),
-                    address=location.get("address"),
-                    phone=contact.get("phone"),
-                    website=contact.get("website"),
-                    email=contact.get("email"),
-                    source_task=data.get("task_id", source),
-                    extra_data={
-                        "business_details": data.get("business_details"),
-                        "key_contacts": data.get("key_contacts"),
-                        "online_presence": data.get("online_presence")
-                    }
-                ))
-
-            # Handle direct array of businesses
-            elif isinstance(data, list):
-                for biz in data:
-                    if isinstance(biz, dict) and biz.get("company_name"):
-                        businesses.append(Business(
-                            company_name=biz.get("company_name", ""),
-                            city=biz.get("city", ""),
-                            state=biz.get("state", ""),
-                            address=biz.get("address"),
-                            phone=biz.get("phone"),
-                            website=biz.get("website"),
-                            email=biz.get("email"),
-                            source_task=source
-                        ))
+            shape = _classify(data)
+            if shape is not None:
+                businesses.extend(_HANDLERS[shape](data, result["file"]))
 
         logger.info(f"Extracted {len(businesses)} business records")
         return businesses
@@ -213,18 +311,7 @@ class Aggregator:
         seen = {}
 
         for biz in businesses:
-            key = biz.dedup_key
-
-            if key not in seen:
-                seen[key] = biz
-            else:
-                # Keep the one with more data
-                existing = seen[key]
-                existing_fields = sum(1 for v in existing.to_dict().values() if v)
-                new_fields = sum(1 for v in biz.to_dict().values() if v)
-
-                if new_fields > existing_fields:
-                    seen[key] = biz
+            _keep_richest(seen, biz)
 
         deduplicated = list(seen.values())
         removed = len(businesses) - len(deduplicated)
@@ -232,6 +319,32 @@ class Aggregator:
         logger.info(f"Removed {removed} duplicates, {len(deduplicated)} unique records")
         return deduplicated
 
+    def ingest_one(self, data, source: str) -> int:
+        """
+        Extract and deduplicate a single worker result as it arrives.
+
+        Lets aggregation overlap with task execution instead of re-reading
+        every output file once all workers have finished.
+
+        Args:
+            data: Parsed worker output
+            source: Name used as the source task when the data has none
+
+        Returns:
+            Number of business records extracted
+        """
+        shape = _classify(data)
+        if shape is None:
+            return 0
+
+        businesses = _HANDLERS[shape](data, source)
+        for biz in businesses:
+            _keep_richest(self._ingested, biz)
+
+        self._ingested_files += 1
+        self._ingested_records += len(businesses)
+        return len(businesses)
+
     def export_json(self, businesses: list[Business], filename: str = "results.json") -> Path:
         """
         Export businesses to JSON file.
@@ -245,14 +358,19 @@ class Aggregator:
         """
         output_path = self.output_dir / filename
 
-        data = {
+        header = {
             "generated_at": datetime.now().isoformat(),
             "total_records": len(businesses),
-            "businesses": [biz.to_dict() for biz in businesses]
         }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Stream one record per line instead of materializing the full document
+        with open(output_path, "wb") as f:
+            f.write(json_dumps(header)[:-1])
+            f.write(b', "businesses": [')
+            for i, biz in enumerate(businesses):
+                f.write(b",\n  " if i else b"\n  ")
+                f.write(json_dumps(biz.to_dict()))
+            f.write(b"\n]}\n")
 
         logger.info(f"Exported JSON to {output_path}")
         return output_path
@@ -270,17 +388,13 @@ class Aggregator:
         """
         output_path = self.output_dir / filename
 
-        # Define CSV columns
-        fieldnames = [
-            "company_name", "city", "state", "address",
-            "phone", "website", "email", "industry", "source_task"
-        ]
+        # Rows are plain tuples in column order; no per-row dict lookups
+        row = attrgetter(*_CORE_FIELDS)
 
         with open(output_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            for biz in businesses:
-                writer.writerow(biz.to_dict())
+            writer = csv.writer(f)
+            writer.writerow(_CORE_FIELDS)
+            writer.writerows(row(biz) for biz in businesses)
 
         logger.info(f"Exported CSV to {output_path}")
         return output_path
@@ -312,6 +426,40 @@ class Aggregator:
         unique_businesses = self.deduplicate(businesses)
         console.print(f"  After deduplication: [green]{len(unique_businesses)}[/green] unique records")
 
+        return self._export(unique_businesses, len(results), len(businesses), export_formats)
+
+    def aggregate_ingested(self, export_formats: list[str] = None) -> dict:
+        """
+        Export the results streamed in via ingest_one().
+
+        Args:
+            export_formats: List of formats to export ("json", "csv")
+
+        Returns:
+            Summary statistics
+        """
+        if export_formats is None:
+            export_formats = ["json", "csv"]
+
+        console.print("\n[bold cyan]Finishing streamed aggregation...[/bold cyan]\n")
+
+        unique_businesses = list(self._ingested.values())
+        console.print(f"  Ingested [green]{self._ingested_files}[/green] results")
+        console.print(f"  Extracted [green]{self._ingested_records}[/green] business records")
+        console.print(f"  After deduplication: [green]{len(unique_businesses)}[/green] unique records")
+
+        return self._export(
+            unique_businesses, self._ingested_files, self._ingested_records, export_formats
+        )
+
+    def _export(
+        self,
+        unique_businesses: list[Business],
+        input_files: int,
+        total_records: int,
+        export_formats: list[str]
+    ) -> dict:
+        """Write the requested export formats and build the summary."""
         # Export
         output_files = []
         if "json" in export_formats:
@@ -326,10 +474,10 @@ class Aggregator:
 
         # Generate summary
         summary = {
-            "input_files": len(results),
-            "total_records_found": len(businesses),
+            "input_files": input_files,
+            "total_records_found": total_records,
             "unique_records": len(unique_businesses),
-            "duplicates_removed": len(businesses) - len(unique_businesses),
+            "duplicates_removed": total_records - len(unique_businesses),
             "output_files": output_files
         }
 
@@ -344,13 +492,14 @@ class Aggregator:
             console.print("\n[yellow]No businesses found.[/yellow]")
             return
 
-        # Group by state
-        by_state = {}
+        # Count businesses and distinct cities per state in one pass
+        state_biz_count = Counter()
+        state_cities = defaultdict(set)
         for biz in businesses:
             state = biz.state or "Unknown"
-            if state not in by_state:
-                by_state[state] = []
-            by_state[state].append(biz)
+            state_biz_count[state] += 1
+            if biz.city:
+                state_cities[state].add(biz.city)
 
         # Create summary table
         table = Table(title="\nResults Summary")
@@ -358,13 +507,11 @@ class Aggregator:
         table.add_column("Cities", style="green")
         table.add_column("Businesses", style="yellow", justify="right")
 
-        for state in sorted(by_state.keys()):
-            biz_list = by_state[state]
-            cities = set(b.city for b in biz_list if b.city)
+        for state in sorted(state_biz_count):
             table.add_row(
                 state,
-                str(len(cities)),
-                str(len(biz_list))
+                str(len(state_cities[state])),
+                str(state_biz_count[state])
             )
 
         console.print(table)
@@ -5,6 +5,7 @@ This module defines the interface that all CLI adapters must implement.
 Adapters wrap different AI CLI tools (Gemini, Claude, etc.) with a common interface.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -22,6 +23,9 @@ class ExecutionResult:
 class CLIAdapter(ABC):
     """Abstract base class for AI CLI adapters."""
 
+    # True if execute_batch runs several prompts in one CLI invocation
+    supports_batch = False
+
     def __init__(self, default_model: str):
         """
         Initialize the adapter.
@@ -53,6 +57,127 @@ class CLIAdapter(ABC):
         """
         pass
 
+    async def execute_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> ExecutionResult:
+        """
+        Execute a prompt from a coroutine.
+
+        The default implementation runs execute() in a worker thread;
+        adapters can override it with a native asyncio subprocess.
+
+        Args:
+            prompt: The prompt to send to the AI
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content to prepend to the prompt
+            timeout: Timeout in seconds for the execution
+
+        Returns:
+            ExecutionResult containing the output and status
+        """
+        return await asyncio.to_thread(self.execute, prompt, model, sop_content, timeout)
+
+    def execute_batch(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts that share the same SOP.
+
+        The default implementation runs each prompt separately; adapters
+        that set supports_batch override this with a single invocation.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return [
+            self.execute(prompt, model, sop_content, timeout)
+            for prompt in prompts
+        ]
+
+    async def execute_batch_async(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts that share the same SOP from a coroutine.
+
+        The default implementation runs execute_batch() in a worker thread;
+        adapters can override it with a native asyncio subprocess.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return await asyncio.to_thread(self.execute_batch, prompts, model, sop_content, timeout)
+
+    def execute_batch_with_web_search(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts with web search enabled.
+
+        Adapters without a separate web search mode run the plain batch.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return self.execute_batch(prompts, model, sop_content, timeout)
+
+    async def execute_batch_with_web_search_async(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts with web search enabled from a coroutine.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return await asyncio.to_thread(
+            self.execute_batch_with_web_search, prompts, model, sop_content, timeout
+        )
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """
@@ -5,13 +5,26 @@ This module provides a subprocess-based wrapper for the Gemini CLI tool.
 It handles executing prompts, model selection, and capturing output.
 """
 
+import os
+import time
+import asyncio
+import hashlib
+import threading
 import subprocess
 import shutil
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from .base import CLIAdapter, ExecutionResult
 
 
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Resolve an executable on PATH once per process."""
+    return shutil.which(name)
+
+
 class GeminiAdapter(CLIAdapter):
     """Adapter for Google's Gemini CLI tool."""
 
@@ -24,22 +37,60 @@ class GeminiAdapter(CLIAdapter):
         "gemini-1.5-flash",
     ]
 
-    def __init__(self, default_model: str = "gemini-2.5-flash"):
+    DEFAULT_CACHE_DIR = Path("~/.cache/leadgenius/gemini")
+
+    # Batched prompts are answered in one invocation, separated by this marker
+    supports_batch = True
+    BATCH_SEPARATOR = "<<<TASK_BOUNDARY>>>"
+
+    def __init__(
+        self,
+        default_model: str = "gemini-2.5-flash",
+        enable_cache: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: float = 86400,
+        max_concurrent: int = 32
+    ):
         """
         Initialize the Gemini adapter.
 
         Args:
             default_model: Default model to use
+            enable_cache: Reuse stored responses for identical model + prompt
+            cache_dir: Directory for cached responses
+            cache_ttl: Seconds before a cached response expires
+            max_concurrent: Maximum CLI processes in flight for execute_async
         """
         super().__init__(default_model)
         self._cli_path = self._find_cli()
+        self._available: Optional[bool] = None
+        self.enable_cache = enable_cache
+        self._cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR).expanduser()
+        self.cache_ttl = cache_ttl
+        self.max_concurrent = max_concurrent
+        self._semaphore: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
 
     def _find_cli(self) -> Optional[str]:
         """Find the Gemini CLI executable."""
-        return shutil.which("gemini")
+        return _which("gemini")
+
+    def is_available(self, refresh: bool = False) -> bool:
+        """
+        Check if Gemini CLI is installed.
+
+        The result of the first probe is cached on the instance.
+
+        Args:
+            refresh: Re-run the probe instead of using the cached result
+        """
+        if self._available is not None and not refresh:
+            return self._available
+
+        self._available = self._probe_cli()
+        return self._available
 
-    def is_available(self) -> bool:
-        """Check if Gemini CLI is installed."""
+    def _probe_cli(self) -> bool:
+        """Run the CLI's --version command to confirm it works."""
         if not self._cli_path:
             return False
 
@@ -54,31 +105,53 @@ class GeminiAdapter(CLIAdapter):
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
+    def _cache_key(self, model: str, full_prompt: str) -> str:
+        """Content hash of the model and full prompt (SOP included)."""
+        return hashlib.blake2b(
+            f"{model}\0{full_prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response if present and not expired."""
+        path = self._cache_dir / key
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            return path.read_text()
+        except OSError:
+            return None
+
+    def _cache_put(self, key: str, output: str) -> None:
+        """Store a response, writing to a temp file and renaming atomically."""
+        path = self._cache_dir / key
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(output)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     def get_available_models(self) -> list[str]:
         """Get list of available Gemini models."""
         return self.MODELS.copy()
 
-    def execute(
+    def _prepare(
         self,
         prompt: str,
-        model: Optional[str] = None,
-        sop_content: Optional[str] = None,
-        timeout: int = 600
-    ) -> ExecutionResult:
+        model: Optional[str],
+        sop_content: Optional[str]
+    ) -> tuple[Optional[list[str]], str, Optional[str], Optional[ExecutionResult]]:
         """
-        Execute a prompt using Gemini CLI.
-
-        Args:
-            prompt: The prompt to send
-            model: Model to use (overrides default)
-            sop_content: Optional SOP content to prepend
-            timeout: Timeout in seconds
+        Build the CLI command for a prompt, or short-circuit with a result.
 
         Returns:
-            ExecutionResult with output and status
+            Tuple of (command, full prompt for stdin, cache key, early result).
+            The early result is set when the CLI is missing or the response
+            is already cached.
         """
         if not self._cli_path:
-            return ExecutionResult(
+            return None, "", None, ExecutionResult(
                 output="",
                 success=False,
                 error="Gemini CLI not found. Please install it first.",
@@ -88,35 +161,80 @@ class GeminiAdapter(CLIAdapter):
         # Build the full prompt with SOP if provided
         full_prompt = self.build_prompt_with_sop(prompt, sop_content)
 
-        # Build command
         model_to_use = model or self.default_model
+
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._cache_key(model_to_use, full_prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return None, full_prompt, None, ExecutionResult(output=cached, success=True, exit_code=0)
+
+        # Build command; the prompt is piped via stdin, which puts the CLI
+        # in non-interactive mode and avoids argv size limits
         cmd = [
             self._cli_path,
-            "--model", model_to_use,
-            "--prompt", full_prompt
+            "--model", model_to_use
         ]
+        return cmd, full_prompt, cache_key, None
+
+    def _to_result(
+        self,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        cache_key: Optional[str]
+    ) -> ExecutionResult:
+        """Convert a finished CLI process into an ExecutionResult."""
+        if returncode == 0:
+            output = stdout.strip()
+            if cache_key:
+                self._cache_put(cache_key, output)
+            return ExecutionResult(
+                output=output,
+                success=True,
+                exit_code=0
+            )
+
+        return ExecutionResult(
+            output=stdout.strip(),
+            success=False,
+            error=stderr.strip() or "Command failed",
+            exit_code=returncode
+        )
+
+    def execute(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> ExecutionResult:
+        """
+        Execute a prompt using Gemini CLI.
+
+        Args:
+            prompt: The prompt to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content to prepend
+            timeout: Timeout in seconds
+
+        Returns:
+            ExecutionResult with output and status
+        """
+        cmd, full_prompt, cache_key, early_result = self._prepare(prompt, model, sop_content)
+        if early_result:
+            return early_result
 
         try:
             result = subprocess.run(
                 cmd,
+                input=full_prompt,
                 capture_output=True,
                 text=True,
                 timeout=timeout
             )
-
-            if result.returncode == 0:
-                return ExecutionResult(
-                    output=result.stdout.strip(),
-                    success=True,
-                    exit_code=0
-                )
-            else:
-                return ExecutionResult(
-                    output=result.stdout.strip(),
-                    success=False,
-                    error=result.stderr.strip() or "Command failed",
-                    exit_code=result.returncode
-                )
+            return self._to_result(result.returncode, result.stdout, result.stderr, cache_key)
 
         except subprocess.TimeoutExpired:
             return ExecutionResult(
@@ -133,6 +251,88 @@ class GeminiAdapter(CLIAdapter):
                 exit_code=-1
             )
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the in-flight process limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrent))
+        return self._semaphore[1]
+
+    async def execute_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> ExecutionResult:
+        """
+        Execute a prompt using Gemini CLI without blocking a thread.
+
+        At most max_concurrent CLI processes run at once per event loop.
+
+        Args:
+            prompt: The prompt to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content to prepend
+            timeout: Timeout in seconds
+
+        Returns:
+            ExecutionResult with output and status
+        """
+        cmd, full_prompt, cache_key, early_result = self._prepare(prompt, model, sop_content)
+        if early_result:
+            return early_result
+
+        async with self._get_semaphore():
+            proc = None
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(full_prompt.encode()), timeout
+                )
+                return self._to_result(
+                    proc.returncode,
+                    stdout.decode(errors="replace"),
+                    stderr.decode(errors="replace"),
+                    cache_key
+                )
+
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return ExecutionResult(
+                    output="",
+                    success=False,
+                    error=f"Command timed out after {timeout} seconds",
+                    exit_code=-1
+                )
+            except asyncio.CancelledError:
+                # Don't leave the CLI running after the caller gave up
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+                    # Close stdin so the transport can finish if the write
+                    # was interrupted; bound the wait in case a child holds
+                    # the output pipes open
+                    if proc.stdin is not None:
+                        proc.stdin.close()
+                    try:
+                        await asyncio.wait_for(proc.wait(), 5)
+                    except asyncio.TimeoutError:
+                        pass
+                raise
+            except Exception as e:
+                return ExecutionResult(
+                    output="",
+                    success=False,
+                    error=str(e),
+                    exit_code=-1
+                )
+
     def execute_with_web_search(
         self,
         prompt: str,
@@ -157,3 +357,180 @@ class GeminiAdapter(CLIAdapter):
         # Add web search indicator to prompt
         web_prompt = f"@web {prompt}"
         return self.execute(web_prompt, model, sop_content, timeout)
+
+    async def execute_with_web_search_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> ExecutionResult:
+        """
+        Execute a prompt with web search enabled, without blocking a thread.
+
+        Args:
+            prompt: The prompt to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content to prepend
+            timeout: Timeout in seconds
+
+        Returns:
+            ExecutionResult with output and status
+        """
+        web_prompt = f"@web {prompt}"
+        return await self.execute_async(web_prompt, model, sop_content, timeout)
+
+    def _combine_batch(self, prompts: list[str], prefix: str) -> str:
+        """Number the prompts and ask for BATCH_SEPARATOR between answers."""
+        sections = "\n\n".join(
+            f"### Task {i}\n{prompt}" for i, prompt in enumerate(prompts, 1)
+        )
+        return (
+            f"{prefix}Complete the following {len(prompts)} independent tasks in order. "
+            f"Answer each task exactly as if it were the only one, and output a line "
+            f"containing only {self.BATCH_SEPARATOR} between consecutive answers.\n\n"
+            f"{sections}"
+        )
+
+    def _split_batch(self, result: ExecutionResult, count: int) -> Optional[list[ExecutionResult]]:
+        """
+        Split a combined result into one result per prompt.
+
+        Returns:
+            Per-prompt results, or None if the output does not follow the
+            separator protocol and each prompt should be re-run on its own
+        """
+        if not result.success:
+            return [result] * count
+
+        outputs = [part.strip() for part in result.output.split(self.BATCH_SEPARATOR)]
+        if len(outputs) != count:
+            return None
+
+        return [
+            ExecutionResult(output=output, success=True, exit_code=0)
+            for output in outputs
+        ]
+
+    def execute_batch(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600,
+        prefix: str = ""
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts in a single Gemini CLI invocation.
+
+        The prompts are numbered and the model is asked to separate its
+        answers with BATCH_SEPARATOR. If the output does not split into
+        one answer per prompt, each prompt is re-run on its own.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+            prefix: Text placed before the combined prompt (e.g. "@web ")
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        if len(prompts) == 1:
+            return [self.execute(prefix + prompts[0], model, sop_content, timeout)]
+
+        result = self.execute(self._combine_batch(prompts, prefix), model, sop_content, timeout)
+        results = self._split_batch(result, len(prompts))
+        if results is not None:
+            return results
+
+        # The model did not follow the separator protocol; fall back
+        per_prompt_timeout = max(1, timeout // len(prompts))
+        return [
+            self.execute(prefix + prompt, model, sop_content, per_prompt_timeout)
+            for prompt in prompts
+        ]
+
+    async def execute_batch_async(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600,
+        prefix: str = ""
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts in a single Gemini CLI invocation, without blocking a thread.
+
+        Same protocol as execute_batch(); cancelling the coroutine kills
+        the CLI process.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+            prefix: Text placed before the combined prompt (e.g. "@web ")
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        if len(prompts) == 1:
+            return [await self.execute_async(prefix + prompts[0], model, sop_content, timeout)]
+
+        result = await self.execute_async(
+            self._combine_batch(prompts, prefix), model, sop_content, timeout
+        )
+        results = self._split_batch(result, len(prompts))
+        if results is not None:
+            return results
+
+        # The model did not follow the separator protocol; fall back
+        per_prompt_timeout = max(1, timeout // len(prompts))
+        return [
+            await self.execute_async(prefix + prompt, model, sop_content, per_prompt_timeout)
+            for prompt in prompts
+        ]
+
+    def execute_batch_with_web_search(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts in one invocation with web search enabled.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return self.execute_batch(prompts, model, sop_content, timeout, prefix="@web ")
+
+    async def execute_batch_with_web_search_async(
+        self,
+        prompts: list[str],
+        model: Optional[str] = None,
+        sop_content: Optional[str] = None,
+        timeout: int = 600
+    ) -> list[ExecutionResult]:
+        """
+        Execute several prompts in one invocation with web search enabled, without blocking a thread.
+
+        Args:
+            prompts: Prompts to send
+            model: Model to use (overrides default)
+            sop_content: Optional SOP content shared by all prompts
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One ExecutionResult per prompt, in order
+        """
+        return await self.execute_batch_async(prompts, model, sop_content, timeout, prefix="@web ")
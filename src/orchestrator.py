@@ -10,8 +10,11 @@ This module manages the overall research process:
 
 import json
 import logging
+import math
+from collections import defaultdict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable
 
 import yaml
 from rich.console import Console
@@ -19,13 +22,77 @@ from rich.panel import Panel
 
 from .cli_adapters.base import CLIAdapter
 from .cli_adapters.gemini_adapter import GeminiAdapter
-from .worker_pool import WorkerPool, Task
+from .worker_pool import WorkerPool, Task, TaskResult
 from .aggregator import Aggregator
+from .utils import json_loads
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Default dispatch priority per task type; follow-up research runs before broad scans
+_TASK_PRIORITIES = {
+    "company_research": 1,
+    "city_search": 0,
+}
+
+
+def _task_priority(task_dict: dict, task_type: str) -> float:
+    """Read a task's priority, falling back to the type default if it is not a finite number."""
+    default = _TASK_PRIORITIES.get(task_type, 0)
+    value = task_dict.get("priority", default)
+    if isinstance(value, bool):
+        return default
+    try:
+        priority = float(value)
+    except (TypeError, ValueError):
+        return default
+    return priority if math.isfinite(priority) else default
+
+
+# Worker prompt templates; missing task keys render as empty strings
+_CITY_SEARCH_PROMPT = """
+Search for businesses in:
+City: {city}
+State: {state}
+Industry: {industry}
+
+Search terms to use: {search_terms}
+Data fields to collect: {data_fields}
+
+Task ID: {task_id}
+
+Find and return information about relevant businesses in this city.
+Output your findings as a JSON object following the format in your instructions.
+"""
+
+_COMPANY_RESEARCH_PROMPT = """
+Research this company:
+Company Name: {company_name}
+Location: {city}, {state}
+Industry: {industry}
+
+Task ID: {task_id}
+
+Gather detailed information about this company.
+Output your findings as a JSON object following the format in your instructions.
+"""
+
+
+@lru_cache(maxsize=None)
+def _read_sop(path_str: str) -> str:
+    """Read an SOP file once per process; every Task shares the same string."""
+    return Path(path_str).read_text()
+
+
+def clear_sop_cache() -> None:
+    """Forget cached SOP contents, e.g. after editing SOP files."""
+    _read_sop.cache_clear()
+
 
 class Orchestrator:
     """
@@ -49,20 +116,58 @@ class Orchestrator:
         self.config_path = config_path or Path("config/settings.yaml")
         self.target_config_path = target_config
 
-        # Load configuration
-        self.config = self._load_config()
-        self.target = self._load_target_config() if target_config else {}
-
-        # Initialize components
-        self.adapter = self._create_adapter()
-        self.worker_pool = self._create_worker_pool()
-        self.aggregator = Aggregator(
+    # Configuration, SOPs and components are loaded on first access, so
+    # code paths that never touch them skip the file I/O entirely.
+
+    @cached_property
+    def config(self) -> dict:
+        """Main configuration (settings.yaml)."""
+        return self._load_config()
+
+    @cached_property
+    def target(self) -> dict:
+        """Target industry configuration."""
+        return self._load_target_config()
+
+    @cached_property
+    def sops(self) -> dict:
+        """SOP contents keyed by role / task type."""
+        return self._load_sops()
+
+    @cached_property
+    def adapter(self) -> CLIAdapter:
+        """CLI adapter used by the manager and workers."""
+        return self._create_adapter()
+
+    @cached_property
+    def worker_pool(self) -> WorkerPool:
+        """Pool that executes worker tasks."""
+        return self._create_worker_pool()
+
+    @cached_property
+    def aggregator(self) -> Aggregator:
+        """Aggregator for worker outputs."""
+        return Aggregator(
             input_dir=Path(self.config.get("paths", {}).get("outputs", "data/outputs")),
             output_dir=Path(self.config.get("output", {}).get("directory", "data/aggregated"))
         )
 
-        # Load SOPs
-        self.sops = self._load_sops()
+    @cached_property
+    def _target_norm(self) -> dict:
+        """Target config with defaults resolved and lists pre-joined for prompts."""
+        industry = self.target.get("industry", "businesses")
+        search_terms = self.target.get("search_terms", [industry])
+        data_fields = self.target.get("data_fields", [
+            "company_name", "address", "phone", "website", "email"
+        ])
+
+        return {
+            "industry": industry,
+            "search_terms": search_terms,
+            "data_fields": data_fields,
+            "search_terms_joined": ", ".join(search_terms),
+            "data_fields_joined": ", ".join(data_fields),
+        }
 
     def _load_config(self) -> dict:
         """Load main configuration file."""
@@ -71,7 +176,7 @@ class Orchestrator:
             return {}
 
         with open(self.config_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
 
     def _load_target_config(self) -> dict:
         """Load target industry configuration."""
@@ -79,16 +184,26 @@ class Orchestrator:
             return {}
 
         with open(self.target_config_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
 
     def _create_adapter(self) -> CLIAdapter:
         """Create the appropriate CLI adapter."""
         cli_type = self.config.get("cli", "gemini")
         models = self.config.get("models", {})
 
+        cache = self.config.get("cache", {})
+        parallelism = self.config.get("parallelism", {})
+
         if cli_type == "gemini":
             default_model = models.get("worker", "gemini-2.5-flash")
-            return GeminiAdapter(default_model=default_model)
+            return GeminiAdapter(
+                default_model=default_model,
+                enable_cache=cache.get("enabled", False),
+                cache_dir=cache.get("directory"),
+                cache_ttl=cache.get("ttl", 86400),
+                # Don't let the adapter cap the pool's configured parallelism
+                max_concurrent=parallelism.get("max_workers", 10)
+            )
         else:
             # Default to Gemini
             return GeminiAdapter()
@@ -102,7 +217,8 @@ class Orchestrator:
             adapter=self.adapter,
             max_workers=parallelism.get("max_workers", 10),
             output_dir=Path(paths.get("outputs", "data/outputs")),
-            spawn_delay=parallelism.get("spawn_delay", 0.5)
+            spawn_delay=parallelism.get("spawn_delay", 0.5),
+            batch_size=parallelism.get("batch_size", 1)
         )
 
     def _load_sops(self) -> dict:
@@ -114,16 +230,16 @@ class Orchestrator:
         # Manager SOP
         manager_sop = sops_dir / "manager" / "research_strategy.md"
         if manager_sop.exists():
-            sops["manager"] = manager_sop.read_text()
+            sops["manager"] = _read_sop(str(manager_sop))
 
         # Worker SOPs
         city_search_sop = sops_dir / "worker" / "city_search.md"
         if city_search_sop.exists():
-            sops["city_search"] = city_search_sop.read_text()
+            sops["city_search"] = _read_sop(str(city_search_sop))
 
         company_research_sop = sops_dir / "worker" / "company_research.md"
         if company_research_sop.exists():
-            sops["company_research"] = company_research_sop.read_text()
+            sops["company_research"] = _read_sop(str(company_research_sop))
 
         logger.info(f"Loaded {len(sops)} SOPs")
         return sops
@@ -138,26 +254,23 @@ class Orchestrator:
         Returns:
             List of task dictionaries
         """
+        states_joined = ", ".join(states)
         console.print(Panel(
             "[bold cyan]Running Manager Agent[/bold cyan]\n"
-            f"Planning research for states: {', '.join(states)}",
+            f"Planning research for states: {states_joined}",
             title="Phase 1: Planning"
         ))
 
         # Build manager prompt
-        industry = self.target.get("industry", "businesses")
-        search_terms = self.target.get("search_terms", [industry])
-        data_fields = self.target.get("data_fields", [
-            "company_name", "address", "phone", "website", "email"
-        ])
+        target = self._target_norm
 
         prompt = f"""
 Generate research tasks for the following:
 
-Industry: {industry}
-States to research: {', '.join(states)}
-Search terms to use: {', '.join(search_terms)}
-Data fields to collect: {', '.join(data_fields)}
+Industry: {target['industry']}
+States to research: {states_joined}
+Search terms to use: {target['search_terms_joined']}
+Data fields to collect: {target['data_fields_joined']}
 
 Generate a JSON array of search tasks for each major city in these states.
 """
@@ -186,7 +299,7 @@ Generate a JSON array of search tasks for each major city in these states.
         """Parse task list from manager output."""
         # Try direct JSON parse
         try:
-            return json.loads(output)
+            return json_loads(output)
         except json.JSONDecodeError:
             pass
 
@@ -197,7 +310,7 @@ Generate a JSON array of search tasks for each major city in these states.
             end = output.rfind(']') + 1
             if end > start:
                 try:
-                    return json.loads(output[start:end])
+                    return json_loads(output[start:end])
                 except json.JSONDecodeError:
                     pass
 
@@ -236,48 +349,41 @@ Generate a JSON array of search tasks for each major city in these states.
                 task_type=task_type,
                 prompt=prompt,
                 sop_content=sop,
-                metadata=task_dict
+                metadata=task_dict,
+                priority=_task_priority(task_dict, task_type)
             ))
 
         return tasks
 
     def _build_city_search_prompt(self, task: dict) -> str:
         """Build prompt for city search task."""
-        return f"""
-Search for businesses in:
-City: {task.get('city', '')}
-State: {task.get('state', '')}
-Industry: {task.get('industry', '')}
-
-Search terms to use: {', '.join(task.get('search_terms', []))}
-Data fields to collect: {', '.join(task.get('data_fields', []))}
+        fields = defaultdict(str, task)
 
-Task ID: {task.get('task_id', '')}
+        # Tasks without their own lists inherit the target's pre-joined ones
+        for key in ("search_terms", "data_fields"):
+            values = task.get(key)
+            fields[key] = (
+                ", ".join(values) if values is not None
+                else self._target_norm[f"{key}_joined"]
+            )
 
-Find and return information about relevant businesses in this city.
-Output your findings as a JSON object following the format in your instructions.
-"""
+        return _CITY_SEARCH_PROMPT.format_map(fields)
 
     def _build_company_research_prompt(self, task: dict) -> str:
         """Build prompt for company research task."""
-        return f"""
-Research this company:
-Company Name: {task.get('company_name', '')}
-Location: {task.get('city', '')}, {task.get('state', '')}
-Industry: {task.get('industry', '')}
+        return _COMPANY_RESEARCH_PROMPT.format_map(defaultdict(str, task))
 
-Task ID: {task.get('task_id', '')}
-
-Gather detailed information about this company.
-Output your findings as a JSON object following the format in your instructions.
-"""
-
-    def run_workers(self, tasks: list[Task]) -> list:
+    def run_workers(
+        self,
+        tasks: list[Task],
+        on_complete: Optional[Callable[[TaskResult], None]] = None
+    ) -> list:
         """
         Run worker agents on the task list.
 
         Args:
             tasks: List of Task objects
+            on_complete: Callback function called when each task completes
 
         Returns:
             List of TaskResult objects
@@ -292,7 +398,9 @@ Output your findings as a JSON object following the format in your instructions.
         worker_model = self.config.get("models", {}).get("worker", "gemini-2.5-flash")
 
         # Execute tasks
-        results = self.worker_pool.execute_tasks(tasks, model=worker_model)
+        results = self.worker_pool.execute_tasks(
+            tasks, model=worker_model, on_complete=on_complete
+        )
 
         # Print stats
         stats = self.worker_pool.get_stats(results)
@@ -302,10 +410,14 @@ Output your findings as a JSON object following the format in your instructions.
 
         return results
 
-    def run_aggregation(self) -> dict:
+    def run_aggregation(self, streamed: bool = False) -> dict:
         """
         Run data aggregation.
 
+        Args:
+            streamed: If True, export the results already ingested during
+                execution instead of loading the output directory
+
         Returns:
             Aggregation summary
         """
@@ -315,15 +427,25 @@ Output your findings as a JSON object following the format in your instructions.
         ))
 
         formats = self.config.get("output", {}).get("formats", ["json", "csv"])
+        if streamed:
+            return self.aggregator.aggregate_ingested(export_formats=formats)
         return self.aggregator.aggregate(export_formats=formats)
 
-    def run(self, states: list[str], skip_aggregation: bool = False) -> dict:
+    def run(
+        self,
+        states: list[str],
+        skip_aggregation: bool = False,
+        stream_aggregation: bool = False
+    ) -> dict:
         """
         Run the complete research workflow.
 
         Args:
             states: List of state abbreviations to research
             skip_aggregation: If True, skip the aggregation step
+            stream_aggregation: If True, aggregate each result as its task
+                completes instead of re-reading the output directory afterwards.
+                Only this run's results are included.
 
         Returns:
             Summary of the research run
@@ -349,14 +471,21 @@ Output your findings as a JSON object following the format in your instructions.
         # Convert to Task objects
         tasks = self.create_worker_tasks(task_dicts)
 
-        # Phase 2: Worker execution
-        results = self.run_workers(tasks)
+        # Phase 2: Worker execution, optionally feeding the aggregator as results arrive
+        stream = stream_aggregation and not skip_aggregation
+        on_complete = None
+        if stream:
+            def on_complete(result: TaskResult) -> None:
+                if result.parsed_data:
+                    self.aggregator.ingest_one(result.parsed_data, f"{result.task_id}.json")
+
+        results = self.run_workers(tasks, on_complete=on_complete)
         worker_stats = self.worker_pool.get_stats(results)
 
         # Phase 3: Aggregation
         aggregation_summary = {}
         if not skip_aggregation:
-            aggregation_summary = self.run_aggregation()
+            aggregation_summary = self.run_aggregation(streamed=stream)
 
         # Final summary
         summary = {
@@ -5,7 +5,56 @@ Utility functions for the Market Research Agent.
 import re
 import json
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+# Phone digit extraction: a translate table for ASCII input, regex otherwise
+_NON_DIGIT_RE = re.compile(r'\D')
+_DELETE_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+        UnicodeDecodeError: If bytes input is not valid UTF-8 and orjson
+            is not installed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
 
 
 def normalize_phone(phone: Optional[str]) -> Optional[str]:
@@ -22,7 +71,10 @@ def normalize_phone(phone: Optional[str]) -> Optional[str]:
         return None
 
     # Remove all non-numeric characters
-    digits = re.sub(r'\D', '', phone)
+    if phone.isascii():
+        digits = phone.translate(_DELETE_NON_DIGITS)
+    else:
+        digits = _NON_DIGIT_RE.sub('', phone)
 
     # Handle US phone numbers
     if len(digits) == 10:
@@ -54,70 +106,112 @@ def normalize_url(url: Optional[str]) -> Optional[str]:
     return url
 
 
-def safe_json_loads(text: str, default: Any = None) -> Any:
+def safe_json_loads(text: Union[str, bytes, bytearray], default: Any = None) -> Any:
     """
     Safely parse JSON with fallback.
 
+    Bytes are parsed directly, without decoding to str first.
+
     Args:
-        text: JSON string
+        text: JSON string or UTF-8 bytes
         default: Default value if parsing fails
 
     Returns:
         Parsed JSON or default value
     """
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
+        return json_loads(text)
+    except (ValueError, TypeError):
+        # ValueError covers JSONDecodeError and invalid UTF-8 in bytes input
         return default
 
 
-def extract_json_from_text(text: str) -> Optional[dict]:
+# Brackets and whole JSON strings; strings are matched so brackets inside
+# them are skipped
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+_JSON_OPENER_RE = re.compile(r'[\[{]')
+
+
+def _find_json_span(text: str, start: int) -> Optional[tuple[int, int]]:
+    """
+    Find the balanced JSON array or object opening at text[start].
+
+    Args:
+        text: Text containing JSON
+        start: Index of the opening '[' or '{'
+
+    Returns:
+        (start, end) slice bounds of the balanced span, or None if unclosed
+    """
+    # The regex scan skips non-bracket characters in C; Python only
+    # visits bracket and string positions
+    depth = 0
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token in '[{':
+            depth += 1
+        elif token in ']}':
+            depth -= 1
+            if depth == 0:
+                return start, match.end()
+
+    return None
+
+
+def _is_record_data(data: Any) -> bool:
+    """Check whether parsed JSON looks like worker data rather than e.g. a citation marker."""
+    if isinstance(data, dict):
+        return True
+    return isinstance(data, list) and bool(data) and all(isinstance(item, dict) for item in data)
+
+
+def extract_json_from_text(text: Union[str, bytes, bytearray]) -> Optional[dict]:
     """
     Extract JSON object or array from text that may contain other content.
 
     Args:
-        text: Text that might contain JSON
+        text: Text (or UTF-8 bytes) that might contain JSON
 
     Returns:
         Parsed JSON or None
     """
-    text = text.strip()
-
-    # Try direct parse first
+    # Try direct parse first; the parser ignores surrounding whitespace and
+    # takes bytes as-is, so pure JSON is never decoded or copied
     result = safe_json_loads(text)
     if result is not None:
         return result
 
-    # Look for JSON array
-    if '[' in text:
-        start = text.find('[')
-        # Find matching closing bracket
-        depth = 0
-        for i, char in enumerate(text[start:], start):
-            if char == '[':
-                depth += 1
-            elif char == ']':
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(text[start:i+1])
-                    except json.JSONDecodeError:
-                        break
-
-    # Look for JSON object
-    if '{' in text:
-        start = text.find('{')
-        depth = 0
-        for i, char in enumerate(text[start:], start):
-            if char == '{':
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    try:
-                        return json.loads(text[start:i+1])
-                    except json.JSONDecodeError:
-                        break
+    if not isinstance(text, str):
+        text = bytes(text).decode(errors="replace")
+    text = text.strip()
+
+    # Scan openers in order and take the first span that holds an object or
+    # a list of objects; prose such as citation markers ("[1]") is skipped
+    skip_until = 0
+    for opener in _JSON_OPENER_RE.finditer(text):
+        start = opener.start()
+        if start < skip_until:
+            continue
+        span = _find_json_span(text, start)
+        if span is None:
+            # Everything after an unclosed opener is inside it; don't pick
+            # a nested fragment out of truncated output
+            break
+        result = safe_json_loads(text[span[0]:span[1]])
+        if _is_record_data(result):
+            return result
+        if result is not None:
+            # Valid JSON of the wrong shape; don't descend into it
+            skip_until = span[1]
+
+    # Fall back to the widest first-opener..last-closer slice
+    for opener, closer in (('[', ']'), ('{', '}')):
+        start = text.find(opener)
+        end = text.rfind(closer) + 1
+        if start != -1 and end > start:
+            result = safe_json_loads(text[start:end])
+            if result is not None:
+                return result
 
     return None
 
@@ -153,30 +247,36 @@ US_STATES = {
     "WI": "Wisconsin", "WY": "Wyoming", "DC": "District of Columbia"
 }
 
+# Valid state abbreviations for membership checks
+VALID_STATES = frozenset(US_STATES)
+
 
 # Major cities by state (for fallback if manager doesn't generate enough cities)
 MAJOR_CITIES = {
-    "TX": ["Houston", "Dallas", "Austin", "San Antonio", "Fort Worth", "El Paso", "Arlington", "Plano"],
-    "CA": ["Los Angeles", "San Francisco", "San Diego", "San Jose", "Sacramento", "Fresno", "Oakland", "Long Beach"],
-    "FL": ["Miami", "Orlando", "Tampa", "Jacksonville", "Fort Lauderdale", "Tallahassee", "St. Petersburg", "Hialeah"],
-    "NY": ["New York City", "Buffalo", "Rochester", "Albany", "Syracuse", "Yonkers"],
-    "IL": ["Chicago", "Aurora", "Naperville", "Rockford", "Springfield", "Peoria"],
-    "PA": ["Philadelphia", "Pittsburgh", "Allentown", "Reading", "Erie", "Scranton"],
-    "OH": ["Columbus", "Cleveland", "Cincinnati", "Toledo", "Akron", "Dayton"],
-    "GA": ["Atlanta", "Augusta", "Savannah", "Columbus", "Macon", "Athens"],
-    "NC": ["Charlotte", "Raleigh", "Greensboro", "Durham", "Winston-Salem", "Fayetteville"],
-    "MI": ["Detroit", "Grand Rapids", "Warren", "Sterling Heights", "Ann Arbor", "Lansing"],
+    "TX": ("Houston", "Dallas", "Austin", "San Antonio", "Fort Worth", "El Paso", "Arlington", "Plano"),
+    "CA": ("Los Angeles", "San Francisco", "San Diego", "San Jose", "Sacramento", "Fresno", "Oakland", "Long Beach"),
+    "FL": ("Miami", "Orlando", "Tampa", "Jacksonville", "Fort Lauderdale", "Tallahassee", "St. Petersburg", "Hialeah"),
+    "NY": ("New York City", "Buffalo", "Rochester", "Albany", "Syracuse", "Yonkers"),
+    "IL": ("Chicago", "Aurora", "Naperville", "Rockford", "Springfield", "Peoria"),
+    "PA": ("Philadelphia", "Pittsburgh", "Allentown", "Reading", "Erie", "Scranton"),
+    "OH": ("Columbus", "Cleveland", "Cincinnati", "Toledo", "Akron", "Dayton"),
+    "GA": ("Atlanta", "Augusta", "Savannah", "Columbus", "Macon", "Athens"),
+    "NC": ("Charlotte", "Raleigh", "Greensboro", "Durham", "Winston-Salem", "Fayetteville"),
+    "MI": ("Detroit", "Grand Rapids", "Warren", "Sterling Heights", "Ann Arbor", "Lansing"),
 }
 
 
-def get_major_cities(state: str) -> list[str]:
+def get_major_cities(state: str) -> tuple[str, ...]:
     """
-    Get list of major cities for a state.
+    Get major cities for a state.
 
     Args:
         state: State abbreviation
 
     Returns:
-        List of city names
+        Tuple of city names (empty if the state is not listed)
     """
-    return MAJOR_CITIES.get(state.upper(), [])
+    cities = MAJOR_CITIES.get(state)
+    if cities is None and not state.isupper():
+        cities = MAJOR_CITIES.get(state.upper())
+    return cities or ()
@@ -2,28 +2,31 @@
 Worker Pool for parallel task execution.
 
 This module manages a pool of worker subprocesses that execute research tasks
-in parallel using the Gemini CLI.
+in parallel using the Gemini CLI, supervised from a single asyncio event loop.
 """
 
-import json
 import time
+import asyncio
+import queue
 import logging
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Iterator, AsyncIterator
 
 from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.console import Console
 
 from .cli_adapters.base import CLIAdapter, ExecutionResult
+from .utils import json_dumps, extract_json_from_text
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A research task to be executed by a worker."""
     task_id: str
@@ -31,9 +34,10 @@ class Task:
     prompt: str
     sop_content: str
     metadata: dict = field(default_factory=dict)
+    priority: float = 0  # higher runs first
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result from executing a task."""
     task_id: str
@@ -44,12 +48,52 @@ class TaskResult:
     execution_time: float = 0.0
 
 
+class _RateLimiter:
+    """
+    Spaces out CLI starts so that at most one begins per interval.
+
+    Workers call acquire() (or acquire_async() from the event loop)
+    themselves, so submission never blocks and waiters sleep outside
+    the lock.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve the next start slot; returns seconds to wait for it."""
+        if self.interval <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        return slot - now
+
+    def acquire(self) -> None:
+        """Block until this caller's start slot arrives."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, for this caller's start slot."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class WorkerPool:
     """
     Manages parallel execution of research tasks.
 
-    Uses ThreadPoolExecutor to run multiple CLI subprocesses concurrently.
-    Each worker is a separate thread that spawns a subprocess to call the CLI.
+    Runs CLI subprocesses concurrently from one asyncio event loop, so
+    waiting on a process costs a file descriptor rather than an OS thread.
+    At most max_workers units of work are in flight at once.
     """
 
     def __init__(
@@ -57,7 +101,9 @@ class WorkerPool:
         adapter: CLIAdapter,
         max_workers: int = 10,
         output_dir: Optional[Path] = None,
-        spawn_delay: float = 0.5
+        spawn_delay: float = 0.5,
+        batch_size: int = 1,
+        pretty_json: bool = False
     ):
         """
         Initialize the worker pool.
@@ -67,11 +113,16 @@ class WorkerPool:
             max_workers: Maximum concurrent workers
             output_dir: Directory to save individual task outputs
             spawn_delay: Delay between spawning workers (rate limiting)
+            batch_size: Tasks per CLI invocation when the adapter supports batching
+            pretty_json: Indent saved task JSON for human inspection
         """
         self.adapter = adapter
         self.max_workers = max_workers
         self.output_dir = output_dir or Path("data/outputs")
         self.spawn_delay = spawn_delay
+        self._rate_limiter = _RateLimiter(spawn_delay)
+        self.batch_size = batch_size
+        self.pretty_json = pretty_json
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -87,6 +138,8 @@ class WorkerPool:
         Returns:
             TaskResult with execution results
         """
+        # Rate limiting happens in the worker, not in the submission loop
+        self._rate_limiter.acquire()
         start_time = time.time()
 
         try:
@@ -98,34 +151,43 @@ class WorkerPool:
                 timeout=600
             )
 
-            execution_time = time.time() - start_time
+            return self._finish_task(task, result, time.time() - start_time)
 
-            if not result.success:
-                return TaskResult(
-                    task_id=task.task_id,
-                    success=False,
-                    error=result.error,
-                    execution_time=execution_time
-                )
+        except Exception as e:
+            logger.exception(f"Error executing task {task.task_id}")
+            return TaskResult(
+                task_id=task.task_id,
+                success=False,
+                error=str(e),
+                execution_time=time.time() - start_time
+            )
 
-            # Try to parse output as JSON
-            parsed_data = None
-            try:
-                parsed_data = json.loads(result.output)
-            except json.JSONDecodeError:
-                # Output might not be pure JSON, try to extract JSON
-                parsed_data = self._extract_json(result.output)
+    async def aexecute_task(self, task: Task, model: Optional[str] = None) -> TaskResult:
+        """
+        Execute a single task from the event loop.
 
-            # Save result to file
-            self._save_result(task.task_id, result.output, parsed_data)
+        Args:
+            task: The task to execute
+            model: Model to use (optional override)
 
-            return TaskResult(
-                task_id=task.task_id,
-                success=True,
-                output=result.output,
-                parsed_data=parsed_data,
-                execution_time=execution_time
+        Returns:
+            TaskResult with execution results
+        """
+        await self._rate_limiter.acquire_async()
+        start_time = time.time()
+
+        try:
+            # Execute via CLI adapter
+            result = await self.adapter.execute_with_web_search_async(
+                prompt=task.prompt,
+                model=model,
+                sop_content=task.sop_content,
+                timeout=600
             )
+            execution_time = time.time() - start_time
+
+            # JSON parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(self._finish_task, task, result, execution_time)
 
         except Exception as e:
             logger.exception(f"Error executing task {task.task_id}")
@@ -136,40 +198,136 @@ class WorkerPool:
                 execution_time=time.time() - start_time
             )
 
-    def _extract_json(self, text: str) -> Optional[dict]:
+    def execute_batch(self, tasks: list[Task], model: Optional[str] = None) -> list[TaskResult]:
         """
-        Try to extract JSON from text that might have other content.
+        Execute tasks sharing one SOP in a single CLI invocation.
 
         Args:
-            text: Text that might contain JSON
+            tasks: Tasks to execute together (same task type and SOP)
+            model: Model to use (optional override)
 
         Returns:
-            Parsed JSON dict or None
+            TaskResults in the same order as tasks
         """
-        # Try to find JSON array or object in the text
-        text = text.strip()
-
-        # Look for JSON array
-        if '[' in text:
-            start = text.find('[')
-            end = text.rfind(']') + 1
-            if end > start:
-                try:
-                    return json.loads(text[start:end])
-                except json.JSONDecodeError:
-                    pass
-
-        # Look for JSON object
-        if '{' in text:
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if end > start:
-                try:
-                    return json.loads(text[start:end])
-                except json.JSONDecodeError:
-                    pass
+        self._rate_limiter.acquire()
+        start_time = time.time()
+
+        try:
+            results = self.adapter.execute_batch_with_web_search(
+                prompts=[task.prompt for task in tasks],
+                model=model,
+                sop_content=tasks[0].sop_content,
+                timeout=600 * len(tasks)
+            )
+            return self._finish_batch(tasks, results, time.time() - start_time)
+
+        except Exception as e:
+            return self._failed_batch(tasks, e, time.time() - start_time)
+
+    async def aexecute_batch(self, tasks: list[Task], model: Optional[str] = None) -> list[TaskResult]:
+        """
+        Execute tasks sharing one SOP in a single CLI invocation from the event loop.
+
+        Args:
+            tasks: Tasks to execute together (same task type and SOP)
+            model: Model to use (optional override)
 
-        return None
+        Returns:
+            TaskResults in the same order as tasks
+        """
+        await self._rate_limiter.acquire_async()
+        start_time = time.time()
+
+        try:
+            results = await self.adapter.execute_batch_with_web_search_async(
+                prompts=[task.prompt for task in tasks],
+                model=model,
+                sop_content=tasks[0].sop_content,
+                timeout=600 * len(tasks)
+            )
+
+            # JSON parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(
+                self._finish_batch, tasks, results, time.time() - start_time
+            )
+
+        except Exception as e:
+            return self._failed_batch(tasks, e, time.time() - start_time)
+
+    def _finish_batch(
+        self,
+        tasks: list[Task],
+        results: list[ExecutionResult],
+        elapsed: float
+    ) -> list[TaskResult]:
+        """Parse and save each task's output, attributing wall time evenly."""
+        execution_time = elapsed / len(tasks)
+        return [
+            self._finish_task(task, result, execution_time)
+            for task, result in zip(tasks, results)
+        ]
+
+    def _failed_batch(self, tasks: list[Task], error: Exception, elapsed: float) -> list[TaskResult]:
+        """Build failed results for every task in a batch that raised."""
+        logger.exception(f"Error executing batch of {len(tasks)} tasks")
+        execution_time = elapsed / len(tasks)
+        return [
+            TaskResult(
+                task_id=task.task_id,
+                success=False,
+                error=str(error),
+                execution_time=execution_time
+            )
+            for task in tasks
+        ]
+
+    def _finish_task(
+        self,
+        task: Task,
+        result: ExecutionResult,
+        execution_time: float
+    ) -> TaskResult:
+        """
+        Parse and save a task's CLI output.
+
+        Args:
+            task: The executed task
+            result: Adapter result for the task
+            execution_time: Time spent executing the task
+
+        Returns:
+            TaskResult for the task
+        """
+        if not result.success:
+            return TaskResult(
+                task_id=task.task_id,
+                success=False,
+                error=result.error,
+                execution_time=execution_time
+            )
+
+        # Parse output as JSON; tolerates prose around the JSON in one pass
+        parsed_data = extract_json_from_text(result.output)
+
+        # Save result to file; this already runs off the event loop
+        try:
+            self._save_result(task.task_id, result.output, parsed_data)
+        except Exception as e:
+            logger.exception(f"Error saving result for task {task.task_id}")
+            return TaskResult(
+                task_id=task.task_id,
+                success=False,
+                error=f"Failed to save result: {e}",
+                execution_time=execution_time
+            )
+
+        return TaskResult(
+            task_id=task.task_id,
+            success=True,
+            output=result.output,
+            parsed_data=parsed_data,
+            execution_time=execution_time
+        )
 
     def _save_result(
         self,
@@ -187,12 +345,195 @@ class WorkerPool:
         """
         # Save raw output
         raw_file = self.output_dir / f"{task_id}_raw.txt"
-        raw_file.write_text(raw_output)
+        raw_file.write_bytes(raw_output.encode())
 
-        # Save parsed JSON if available
+        # Save parsed JSON if available; compact unless pretty output was requested
         if parsed_data:
             json_file = self.output_dir / f"{task_id}.json"
-            json_file.write_text(json.dumps(parsed_data, indent=2))
+            json_file.write_bytes(json_dumps(parsed_data, indent=self.pretty_json))
+
+    def _dispatch_order(self, tasks: list[Task]) -> list[Task]:
+        """
+        Order tasks by priority, highest first.
+
+        The sort is stable, so tasks of equal priority keep their FIFO
+        order. Units are started in this order, so it is the dispatch order.
+        """
+        return sorted(tasks, key=lambda task: -task.priority)
+
+    def _make_batches(self, tasks: list[Task]) -> list[list[Task]]:
+        """
+        Group dispatch-ordered tasks into units of work.
+
+        Tasks are batched by (task_type, sop_content, priority) up to
+        batch_size when the adapter supports batch execution; otherwise each
+        task is its own unit. Units keep the dispatch order of their first
+        task, so no task starts ahead of a higher-priority one.
+        """
+        ordered = self._dispatch_order(tasks)
+        if self.batch_size <= 1 or not getattr(self.adapter, "supports_batch", False):
+            return [[task] for task in ordered]
+
+        groups: dict[tuple[str, str, float], list[Task]] = {}
+        for task in ordered:
+            key = (task.task_type, task.sop_content, task.priority)
+            groups.setdefault(key, []).append(task)
+
+        units = [
+            group[i:i + self.batch_size]
+            for group in groups.values()
+            for i in range(0, len(group), self.batch_size)
+        ]
+
+        # Grouping interleaves units across groups; restore dispatch order
+        # by each unit's leading task
+        position = {id(task): i for i, task in enumerate(ordered)}
+        units.sort(key=lambda unit: position[id(unit[0])])
+        return units
+
+    async def _run_unit(
+        self,
+        batch: list[Task],
+        model: Optional[str],
+        semaphore: asyncio.Semaphore
+    ) -> tuple[list[Task], list[TaskResult]]:
+        """Execute one unit of work from _make_batches once a slot is free."""
+        async with semaphore:
+            if len(batch) == 1:
+                return batch, [await self.aexecute_task(batch[0], model)]
+            return batch, await self.aexecute_batch(batch, model)
+
+    async def _aiter_results(
+        self,
+        tasks: list[Task],
+        model: Optional[str]
+    ) -> AsyncIterator[tuple[Task, TaskResult]]:
+        """Yield (task, result) pairs as units of work complete."""
+        # Units are created in dispatch order; the semaphore admits
+        # waiters first-come first-served, preserving that order
+        semaphore = asyncio.Semaphore(self.max_workers)
+        pending = [
+            asyncio.ensure_future(self._run_unit(batch, model, semaphore))
+            for batch in self._make_batches(tasks)
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(pending):
+                batch, batch_results = await next_done
+                for task, result in zip(batch, batch_results):
+                    yield task, result
+        finally:
+            # Cancel unfinished units ourselves and wait for them, so their
+            # subprocesses are killed before the loop starts shutting down
+            for unit in pending:
+                unit.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _progress_bar(self) -> Progress:
+        """Create the progress display used while executing tasks."""
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=console
+        )
+
+    def _report(self, progress: Progress, progress_id: TaskID, task: Task, result: TaskResult) -> None:
+        """Update progress and log the outcome of one task."""
+        status = "[green]✓" if result.success else "[red]✗"
+        progress.update(
+            progress_id,
+            advance=1,
+            description=f"{status} {task.task_id}"
+        )
+
+        if result.success:
+            logger.info(
+                f"Task {task.task_id} completed in {result.execution_time:.1f}s"
+            )
+        else:
+            logger.warning(
+                f"Task {task.task_id} failed: {result.error}"
+            )
+
+    def _notify(self, on_complete: Callable[[TaskResult], None], result: TaskResult) -> None:
+        """Run a completion callback; a failing callback must not abort the run."""
+        try:
+            on_complete(result)
+        except Exception:
+            logger.exception(f"Completion callback failed for {result.task_id}")
+
+    def iter_results(
+        self,
+        tasks: list[Task],
+        model: Optional[str] = None
+    ) -> Iterator[TaskResult]:
+        """
+        Execute tasks in parallel, yielding each result as it completes.
+
+        The event loop runs on a background thread, so the caller can
+        process result N (e.g. aggregate it) while later tasks still run.
+
+        Args:
+            tasks: List of tasks to execute
+            model: Model to use for all tasks
+
+        Yields:
+            TaskResults in completion order
+        """
+        results_queue: queue.Queue = queue.Queue()
+        done = object()
+        loop: Optional[asyncio.AbstractEventLoop] = None
+        main_task: Optional[asyncio.Task] = None
+
+        async def pump() -> None:
+            nonlocal loop, main_task
+            loop = asyncio.get_running_loop()
+            main_task = asyncio.current_task()
+            # Blocking work (batches, parsing, sync adapters) runs on the
+            # default executor; size it so it never caps max_workers
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="worker")
+            )
+            async for item in self._aiter_results(tasks, model):
+                results_queue.put(item)
+
+        def run_loop() -> None:
+            try:
+                asyncio.run(pump())
+            except BaseException as e:
+                results_queue.put(e)
+            finally:
+                results_queue.put(done)
+
+        loop_thread = threading.Thread(target=run_loop, name="worker-loop", daemon=True)
+        loop_thread.start()
+
+        try:
+            with self._progress_bar() as progress:
+                progress_id = progress.add_task(
+                    f"[cyan]Executing {len(tasks)} tasks...",
+                    total=len(tasks)
+                )
+
+                while (item := results_queue.get()) is not done:
+                    if isinstance(item, BaseException):
+                        raise item
+
+                    task, result = item
+                    self._report(progress, progress_id, task, result)
+                    yield result
+        finally:
+            # On early exit (consumer error or break), stop the remaining work;
+            # asyncio.run() cancels the outstanding units as the loop winds down
+            if loop_thread.is_alive() and loop is not None and main_task is not None:
+                try:
+                    loop.call_soon_threadsafe(main_task.cancel)
+                except RuntimeError:
+                    pass  # Loop already closed
+            loop_thread.join()
 
     def execute_tasks(
         self,
@@ -213,66 +554,12 @@ class WorkerPool:
         """
         results = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-
-            task_id = progress.add_task(
-                f"[cyan]Executing {len(tasks)} tasks...",
-                total=len(tasks)
-            )
+        for result in self.iter_results(tasks, model):
+            results.append(result)
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                future_to_task = {}
-                for i, task in enumerate(tasks):
-                    if i > 0:
-                        time.sleep(self.spawn_delay)  # Rate limiting
-
-                    future = executor.submit(self.execute_task, task, model)
-                    future_to_task[future] = task
-
-                # Collect results as they complete
-                for future in as_completed(future_to_task):
-                    task = future_to_task[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-
-                        # Update progress
-                        status = "[green]✓" if result.success else "[red]✗"
-                        progress.update(
-                            task_id,
-                            advance=1,
-                            description=f"{status} {task.task_id}"
-                        )
-
-                        # Call completion callback
-                        if on_complete:
-                            on_complete(result)
-
-                        if result.success:
-                            logger.info(
-                                f"Task {task.task_id} completed in {result.execution_time:.1f}s"
-                            )
-                        else:
-                            logger.warning(
-                                f"Task {task.task_id} failed: {result.error}"
-                            )
-
-                    except Exception as e:
-                        logger.exception(f"Error collecting result for {task.task_id}")
-                        results.append(TaskResult(
-                            task_id=task.task_id,
-                            success=False,
-                            error=str(e)
-                        ))
-                        progress.update(task_id, advance=1)
+            # Call completion callback
+            if on_complete:
+                self._notify(on_complete, result)
 
         return results
 
@@ -286,18 +573,27 @@ class WorkerPool:
         Returns:
             Dictionary of statistics
         """
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        successful = 0
+        total_time = 0.0
+        failed_task_ids = []
+
+        # Single pass over the results
+        for r in results:
+            total_time += r.execution_time
+            if r.success:
+                successful += 1
+            else:
+                failed_task_ids.append(r.task_id)
 
-        total_time = sum(r.execution_time for r in results)
-        avg_time = total_time / len(results) if results else 0
+        total = len(results)
+        avg_time = total_time / total if total else 0
 
         return {
-            "total_tasks": len(results),
-            "successful": len(successful),
-            "failed": len(failed),
-            "success_rate": len(successful) / len(results) * 100 if results else 0,
+            "total_tasks": total,
+            "successful": successful,
+            "failed": len(failed_task_ids),
+            "success_rate": successful / total * 100 if total else 0,
             "total_time": total_time,
             "average_time": avg_time,
-            "failed_task_ids": [r.task_id for r in failed]
+            "failed_task_ids": failed_task_ids
         }